@@ -1,14 +1,45 @@
-import xml.etree.ElementTree as ET
-import json
+import functools
 import re
+import sys
 
+# Prefer orjson for faster parsing of large Swagger specs
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Prefer lxml for its C-level iterparse; fall back to the standard library
+try:
+    from lxml import etree as ET
+    LXML_AVAILABLE = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    LXML_AVAILABLE = False
+
+# Selects the stringProps of a sampler; parse_jmeter_endpoints picks the ones it needs by name
+if LXML_AVAILABLE:
+    # Compiled once so the expression isn't re-parsed for every sampler
+    _select_sampler_props = ET.XPath(
+        "stringProp[@name='HTTPSampler.method' or @name='HTTPSampler.path' or @name='TestElement.name']"
+    )
+else:
+    def _select_sampler_props(sampler):
+        return sampler.iterfind("stringProp")
+
+# Label reported for samplers without a TestElement.name property
+_NO_LABEL = "No Label"
+
+# Matches JMeter variable references such as ${engagementId}
+_JMETER_VAR_RE = re.compile(r'\$\{([^}]+)\}')
+
+@functools.lru_cache(maxsize=4096)
 def jmeter_path_to_swagger_style(path):
     """
     Convert /api/v1/engagement/${engagementId} 
     to /api/v1/engagement/{engagementId}
     for easier comparison with Swagger.
     """
-    return re.sub(r'\$\{([^\}]+)\}', r'{\1}', path)
+    return _JMETER_VAR_RE.sub(r'{\1}', path)
 
 def parse_jmeter_endpoints(jmx_file_path):
     """
@@ -19,47 +50,72 @@ def parse_jmeter_endpoints(jmx_file_path):
       - label: e.g. "Create Engagement" (if found)
     Preserves duplicates if the same endpoint is repeated.
     """
-    tree = ET.parse(jmx_file_path)
-    root = tree.getroot()
-    
     jmeter_endpoints = []
     
+    # Stream the file so only the sampler being processed is kept in memory
+    if LXML_AVAILABLE:
+        context = ET.iterparse(jmx_file_path, events=("end",), tag="HTTPSamplerProxy")
+    else:
+        context = ET.iterparse(jmx_file_path, events=("end",))
+    
     # Each HTTPSamplerProxy typically represents one request
-    for sampler in root.iter('HTTPSamplerProxy'):
-        method_element = sampler.find("./stringProp[@name='HTTPSampler.method']")
-        path_element = sampler.find("./stringProp[@name='HTTPSampler.path']")
+    for _, sampler in context:
+        if sampler.tag != "HTTPSamplerProxy":
+            continue
+        
+        # Fetch the sampler's properties in one pass, keeping the first of each name
+        props = {}
+        for prop in _select_sampler_props(sampler):
+            props.setdefault(prop.get("name"), prop)
+        
+        method_element = props.get("HTTPSampler.method")
+        path_element = props.get("HTTPSampler.path")
         
         # Optional: Sampler name or label
-        label_element = sampler.find("./stringProp[@name='TestElement.name']")
+        label_element = props.get("TestElement.name")
         
         if method_element is not None and path_element is not None:
             jmeter_endpoints.append({
                 "method": method_element.text.strip(),
                 "path": path_element.text.strip(),
-                "label": label_element.text.strip() if label_element is not None else "No Label"
+                "label": label_element.text.strip() if label_element is not None else _NO_LABEL
             })
+        
+        # Free the sampler; lxml also lets us drop the siblings already processed
+        sampler.clear()
+        if LXML_AVAILABLE:
+            while sampler.getprevious() is not None:
+                del sampler.getparent()[0]
     
     return jmeter_endpoints
 
+# OpenAPI methods are a small closed set, so their (interned) uppercase forms are cached
+_UPPER_METHODS = {}  # e.g., {"get": "GET", "post": "POST"}
+
+def _upper_method(method):
+    upper = _UPPER_METHODS.get(method)
+    if upper is None:
+        upper = _UPPER_METHODS[method] = sys.intern(method.upper())
+    return upper
+
 def parse_swagger_endpoints(swagger_file_path):
     """
     Parses the Swagger JSON file and returns a set of (method, path).
     Each path is e.g. "/api/v2/engagement/{engagementId}" 
     and method is uppercase ("POST", "GET", etc.)
     """
-    with open(swagger_file_path, "r") as f:
-        swagger_data = json.load(f)
+    with open(swagger_file_path, "rb") as f:
+        swagger_data = json_loads(f.read())
     
-    swagger_set = set()
     paths = swagger_data.get("paths", {})
     
-    for path, operations in paths.items():
-        # operations might be {"get": {...}, "post": {...}, ...}
-        for method in operations.keys():
-            method_upper = method.upper()
-            swagger_set.add((method_upper, path))
-    
-    return swagger_set
+    # operations might be {"get": {...}, "post": {...}, ...}
+    # Strings are interned so lookups from compare_endpoints hit on identity
+    return {
+        (_upper_method(method), sys.intern(path))
+        for path, operations in paths.items()
+        for method in operations
+    }
 
 def compare_endpoints(jmeter_endpoints, swagger_endpoints_set):
     """
@@ -74,45 +130,48 @@ def compare_endpoints(jmeter_endpoints, swagger_endpoints_set):
                            in JMeter, reported once with a count.
     """
     
-    # We'll keep track of normalized combos for each JMeter endpoint
-    jmeter_combos = []  # e.g., [("POST", "/api/v1/engagement/{engagementId}"), ...]
+    # We'll keep one [count, in_swagger] entry per normalized combo, so each combo
+    # is looked up in Swagger only once however often it repeats in JMeter
+    combo_state = {}  # e.g., {("POST", "/api/v1/engagement/{engagementId}"): [2, True], ...}
     
     matched_in_jmeter = []
     missing_in_swagger = []
     
+    # Normalize each distinct raw path only once. Methods and normalized paths are
+    # interned like the Swagger side, so matching tuples compare by identity.
+    norm_cache = {}  # e.g., {"/api/v1/engagement/${engagementId}": "/api/v1/engagement/{engagementId}"}
+    
     for ep in jmeter_endpoints:
-        norm_path = jmeter_path_to_swagger_style(ep["path"])
-        combo = (ep["method"], norm_path)
-        jmeter_combos.append(combo)
+        raw_path = ep["path"]
+        norm_path = norm_cache.get(raw_path)
+        if norm_path is None:
+            norm_path = norm_cache[raw_path] = sys.intern(jmeter_path_to_swagger_style(raw_path))
+        combo = (sys.intern(ep["method"]), norm_path)
+        
+        state = combo_state.get(combo)
+        if state is None:
+            # First sighting: check if this combo is in Swagger
+            state = combo_state[combo] = [0, combo in swagger_endpoints_set]
+        state[0] += 1
         
-        # Check if this combo is in Swagger
-        if combo in swagger_endpoints_set:
+        if state[1]:
             matched_in_jmeter.append(ep)  # Keep original detail
         else:
             missing_in_swagger.append(ep)
     
+    # The state keys double as the set of distinct JMeter combos
+    jmeter_set = combo_state.keys()
+    
     # Identify what's missing in JMeter from Swagger
-    jmeter_set = set(jmeter_combos)
-    missing_in_jmeter = []
-    for (method, path) in swagger_endpoints_set:
-        if (method, path) not in jmeter_set:
-            missing_in_jmeter.append({"method": method, "path": path})
-    
-    # Detect duplicates
-    # We'll count how many times each combo appears in jmeter_combos.
-    combo_count = {}
-    for combo in jmeter_combos:
-        combo_count[combo] = combo_count.get(combo, 0) + 1
-    
-    duplicates = []
-    for combo, cnt in combo_count.items():
-        if cnt > 1:
-            # Just list each duplicate once
-            duplicates.append({
-                "method": combo[0],
-                "path": combo[1],
-                "count": cnt
-            })
+    missing_combos = swagger_endpoints_set - jmeter_set
+    missing_in_jmeter = [{"method": method, "path": path} for (method, path) in missing_combos]
+    
+    # Detect duplicates, listing each one once
+    duplicates = [
+        {"method": method, "path": path, "count": cnt}
+        for (method, path), (cnt, _) in combo_state.items()
+        if cnt > 1
+    ]
     
     return matched_in_jmeter, missing_in_swagger, missing_in_jmeter, duplicates
 
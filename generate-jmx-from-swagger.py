@@ -1,7 +1,162 @@
-import json
-import xml.etree.ElementTree as ET
 import sys
 import os
+from xml.sax.saxutils import escape
+
+# Prefer orjson for faster parsing of large Swagger specs
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+# Entities needed on top of escape() for text placed inside a double-quoted attribute
+_ATTR_ENTITIES = {'"': "&quot;", "\n": "&#10;", "\r": "&#13;", "\t": "&#9;"}
+
+# The test plan is fixed apart from its User Defined Variables and HTTP Samplers,
+# so it is written as three static sections around them:
+# _JMX_PREAMBLE, variables, _JMX_THREAD_GROUP, samplers, _JMX_EPILOGUE
+_JMX_PREAMBLE = (
+    b'<?xml version="1.0" encoding="UTF-8"?>\n'
+    b'<jmeterTestPlan version="1.2" properties="5.0" jmeter="5.6.3">'
+    b'<hashTree>'
+    b'<TestPlan guiclass="TestPlanGui" testclass="TestPlan" testname="Test Plan">'
+    b'<elementProp name="TestPlan.user_defined_variables" elementType="Arguments">'
+    b'<collectionProp name="Arguments.arguments"/>'
+    b'</elementProp>'
+    b'<stringProp name="TestPlan.user_define_classpath"/>'
+    b'</TestPlan>'
+    b'<hashTree>'
+    b'<Arguments guiclass="ArgumentsPanel" testclass="Arguments" testname="User Defined Variables">'
+)
+
+_JMX_THREAD_GROUP = (
+    b'</Arguments>'
+    b'<hashTree/>'
+    b'<ThreadGroup guiclass="ThreadGroupGui" testclass="ThreadGroup" testname="Thread Group">'
+    b'<intProp name="ThreadGroup.num_threads">1</intProp>'
+    b'<intProp name="ThreadGroup.ramp_time">1</intProp>'
+    b'<longProp name="ThreadGroup.duration">0</longProp>'
+    b'<boolProp name="ThreadGroup.scheduler">false</boolProp>'
+    b'<elementProp name="ThreadGroup.main_controller" elementType="LoopController">'
+    b'<stringProp name="LoopController.loops">1</stringProp>'
+    b'<boolProp name="LoopController.continue_forever">false</boolProp>'
+    b'</elementProp>'
+    b'</ThreadGroup>'
+    b'<hashTree>'
+)
+
+# Closes the Thread Group and Test Plan, then adds the listeners
+_JMX_EPILOGUE = (
+    b'</hashTree>'
+    b'</hashTree>'
+    b'<ResultCollector guiclass="ViewResultsFullVisualizer" testclass="ResultCollector" testname="View Results Tree" enabled="true">'
+    b'<boolProp name="ResultCollector.error_logging">false</boolProp>'
+    b'</ResultCollector>'
+    b'<hashTree/>'
+    b'<ResultCollector guiclass="SummaryReport" testclass="ResultCollector" testname="Summary Report" enabled="true">'
+    b'<boolProp name="ResultCollector.error_logging">false</boolProp>'
+    b'</ResultCollector>'
+    b'<hashTree/>'
+    b'</hashTree>'
+    b'</jmeterTestPlan>'
+)
+
+# A single User Defined Variable of the Test Plan
+_USER_DEFINED_VARIABLE_TEMPLATE = (
+    '<elementProp name="{name}" elementType="Argument">'
+    '<stringProp name="Argument.name">{name}</stringProp>'
+    '<stringProp name="Argument.value"/>'
+    '<stringProp name="Argument.metadata">=</stringProp>'
+    '</elementProp>'
+)
+
+# Everything in an HTTP sampler except its name, path, method and query arguments is
+# the same for every operation, so it is pre-formatted once. The sampler's hashTree
+# holds the Header Manager for Authorization.
+_SAMPLER_TEMPLATE = (
+    '<HTTPSamplerProxy guiclass="HttpTestSampleGui" testclass="HTTPSamplerProxy" testname="{method} {path}">'
+    '<stringProp name="HTTPSampler.domain">${{HOSTNAME}}</stringProp>'
+    '<stringProp name="HTTPSampler.protocol">https</stringProp>'
+    '<stringProp name="HTTPSampler.port">443</stringProp>'
+    '<stringProp name="HTTPSampler.path">{path}</stringProp>'
+    '<stringProp name="HTTPSampler.method">{method}</stringProp>'
+    '<boolProp name="HTTPSampler.auto_redirects">true</boolProp>'
+    '<elementProp name="HTTPsampler.Arguments" elementType="Arguments">'
+    '{arguments}'
+    '</elementProp>'
+    '</HTTPSamplerProxy>'
+    '<hashTree>'
+    '<HeaderManager guiclass="HeaderPanel" testclass="HeaderManager" testname="HTTP Header Manager">'
+    '<collectionProp name="HeaderManager.headers">'
+    '<elementProp name="" elementType="Header">'
+    '<stringProp name="Header.name">Authorization</stringProp>'
+    '<stringProp name="Header.value">${{auth_token}}</stringProp>'
+    '</elementProp>'
+    '</collectionProp>'
+    '</HeaderManager>'
+    '</hashTree>'
+)
+
+# An Arguments.arguments collection, collapsed to an empty tag when there are no entries
+_ARGUMENTS_TEMPLATE = '<collectionProp name="Arguments.arguments">{}</collectionProp>'
+_NO_ARGUMENTS = '<collectionProp name="Arguments.arguments"/>'
+
+# A single query parameter of an HTTP sampler
+_QUERY_ARGUMENT_TEMPLATE = (
+    '<elementProp name="{name}" elementType="HTTPArgument">'
+    '<boolProp name="HTTPArgument.always_encode">true</boolProp>'
+    '<stringProp name="Argument.name">{name}</stringProp>'
+    '<stringProp name="Argument.value">${{{name}}}</stringProp>'
+    '<stringProp name="Argument.metadata">=</stringProp>'
+    '</elementProp>'
+)
+
+def _escape_attr(value):
+    """
+    Escape a value so it can be used as element text or inside a double-quoted attribute.
+
+    :param value: Raw string from the Swagger JSON
+    :return: The escaped string
+    """
+    return escape(value, _ATTR_ENTITIES)
+
+def _render_dynamic_vars(dynamic_vars):
+    """
+    Render the Arguments.arguments collection holding the User Defined Variables.
+
+    :param dynamic_vars: Names of the parameters found in the Swagger JSON
+    :return: The collectionProp XML as UTF-8 encoded bytes
+    """
+    if not dynamic_vars:
+        return _NO_ARGUMENTS.encode("utf-8")
+    return _ARGUMENTS_TEMPLATE.format("".join(
+        _USER_DEFINED_VARIABLE_TEMPLATE.format(name=_escape_attr(var)) for var in dynamic_vars
+    )).encode("utf-8")
+
+def _render_arguments(query_names):
+    """
+    Render the Arguments.arguments collection holding a sampler's query parameters.
+
+    :param query_names: Names of the operation's query parameters, in order
+    :return: The collectionProp XML
+    """
+    if not query_names:
+        return _NO_ARGUMENTS
+    return _ARGUMENTS_TEMPLATE.format("".join(
+        _QUERY_ARGUMENT_TEMPLATE.format(name=_escape_attr(name)) for name in query_names
+    ))
+
+def _render_sampler(method, path, arguments):
+    """
+    Render the HTTP sampler for one Swagger operation, followed by its Header Manager.
+
+    :param method: HTTP method as found in the Swagger JSON, e.g. "get"
+    :param path: API path, e.g. "/api/v1/engagement/{engagementId}"
+    :param arguments: The sampler's arguments as rendered by _render_arguments
+    :return: The sampler XML as UTF-8 encoded bytes
+    """
+    return _SAMPLER_TEMPLATE.format(
+        method=_escape_attr(method.upper()), path=_escape_attr(path), arguments=arguments
+    ).encode("utf-8")
 
 def generate_jmx_from_swagger(swagger_json, output_file="generated_test_plan.jmx"):
     """
@@ -15,120 +170,40 @@ def generate_jmx_from_swagger(swagger_json, output_file="generated_test_plan.jmx
         if "paths" not in swagger_json:
             raise ValueError("Invalid Swagger JSON: 'paths' section missing.")
 
-        # Create the root Test Plan element
-        jmeter_test_plan = ET.Element("jmeterTestPlan", attrib={
-            "version": "1.2", "properties": "5.0", "jmeter": "5.6.3"
-        })
-        hash_tree = ET.SubElement(jmeter_test_plan, "hashTree")
-
-        # Test Plan setup
-        test_plan = ET.SubElement(hash_tree, "TestPlan", attrib={
-            "guiclass": "TestPlanGui", "testclass": "TestPlan", "testname": "Test Plan"
-        })
-        user_defined_vars = ET.SubElement(test_plan, "elementProp", attrib={
-            "name": "TestPlan.user_defined_variables", "elementType": "Arguments"
-        })
-        ET.SubElement(user_defined_vars, "collectionProp", attrib={"name": "Arguments.arguments"})
-        ET.SubElement(test_plan, "stringProp", attrib={"name": "TestPlan.user_define_classpath"}).text = ""
-
-        test_plan_hash_tree = ET.SubElement(hash_tree, "hashTree")
-
-        # Dynamically Add User Defined Variables based on Swagger parameters
-        arguments = ET.SubElement(test_plan_hash_tree, "Arguments", attrib={
-            "guiclass": "ArgumentsPanel", "testclass": "Arguments", "testname": "User Defined Variables"
-        })
-        collection = ET.SubElement(arguments, "collectionProp", attrib={"name": "Arguments.arguments"})
-
+        # Walk the Swagger paths once, rendering the HTTP Samplers and collecting
+        # User Defined Variables from their parameters at the same time
         dynamic_vars = set()
+        sampler_chunks = []
+        # Operations often share the same query parameters (e.g. paging on list endpoints),
+        # so each distinct argument list is rendered only once
+        arguments_cache = {}  # e.g., {("page", "size"): '<collectionProp ...>...</collectionProp>'}
         for path, methods in swagger_json["paths"].items():
-            for method_details in methods.values():
-                parameters = method_details.get("parameters", [])
-                for param in parameters:
-                    dynamic_vars.add(param["name"])
+            for method, details in methods.items():
+                parameters = details.get("parameters", [])
+                dynamic_vars.update(param["name"] for param in parameters)
 
-        for var in dynamic_vars:
-            var_element = ET.SubElement(collection, "elementProp", attrib={
-                "name": var, "elementType": "Argument"
-            })
-            ET.SubElement(var_element, "stringProp", attrib={"name": "Argument.name"}).text = var
-            ET.SubElement(var_element, "stringProp", attrib={"name": "Argument.value"}).text = ""
-            ET.SubElement(var_element, "stringProp", attrib={"name": "Argument.metadata"}).text = "="
+                # Add query parameters or body parameters as arguments
+                query_names = tuple(
+                    param.get("name", "parameter") for param in parameters
+                    if param.get("in", "query") == "query"  # 'query', 'body', etc.
+                )
+                arguments = arguments_cache.get(query_names)
+                if arguments is None:
+                    arguments = arguments_cache[query_names] = _render_arguments(query_names)
 
-        ET.SubElement(test_plan_hash_tree, "hashTree")
+                sampler_chunks.append(_render_sampler(method, path, arguments))
 
         # Get the server URL from the Swagger JSON
         server_url = extract_server_url(swagger_json)
         print(f"Using server URL as prefix to API endpoint: {server_url}")
 
-        # Add Thread Group
-        thread_group = ET.SubElement(test_plan_hash_tree, "ThreadGroup", attrib={
-            "guiclass": "ThreadGroupGui", "testclass": "ThreadGroup", "testname": "Thread Group"
-        })
-        ET.SubElement(thread_group, "intProp", attrib={"name": "ThreadGroup.num_threads"}).text = "1"
-        ET.SubElement(thread_group, "intProp", attrib={"name": "ThreadGroup.ramp_time"}).text = "1"
-        ET.SubElement(thread_group, "longProp", attrib={"name": "ThreadGroup.duration"}).text = "0"
-        ET.SubElement(thread_group, "boolProp", attrib={"name": "ThreadGroup.scheduler"}).text = "false"
-        loop_controller = ET.SubElement(thread_group, "elementProp", attrib={
-            "name": "ThreadGroup.main_controller", "elementType": "LoopController"
-        })
-        ET.SubElement(loop_controller, "stringProp", attrib={"name": "LoopController.loops"}).text = "1"
-        ET.SubElement(loop_controller, "boolProp", attrib={"name": "LoopController.continue_forever"}).text = "false"
-
-        thread_group_hash_tree = ET.SubElement(test_plan_hash_tree, "hashTree")
-
-        # Add HTTP Samplers and Header Manager
-        for path, methods in swagger_json["paths"].items():
-            for method, details in methods.items():
-                sampler = ET.SubElement(thread_group_hash_tree, "HTTPSamplerProxy", attrib={
-                    "guiclass": "HttpTestSampleGui", "testclass": "HTTPSamplerProxy",
-                    "testname": f"{method.upper()} {path}"
-                })
-                ET.SubElement(sampler, "stringProp", attrib={"name": "HTTPSampler.domain"}).text = "${HOSTNAME}"
-                ET.SubElement(sampler, "stringProp", attrib={"name": "HTTPSampler.protocol"}).text = "https"
-                ET.SubElement(sampler, "stringProp", attrib={"name": "HTTPSampler.port"}).text = "443"
-                ET.SubElement(sampler, "stringProp", attrib={"name": "HTTPSampler.path"}).text = path
-                ET.SubElement(sampler, "stringProp", attrib={"name": "HTTPSampler.method"}).text = method.upper()
-                ET.SubElement(sampler, "boolProp", attrib={"name": "HTTPSampler.auto_redirects"}).text = "true"
-                sampler_arguments = ET.SubElement(sampler, "elementProp", name="HTTPsampler.Arguments", elementType="Arguments")
-                collection_prop = ET.SubElement(sampler_arguments, "collectionProp", name="Arguments.arguments")
-
-                # Add query parameters or body parameters as arguments
-                request_parameters = details.get("parameters", [])
-                for request_param in request_parameters:
-                    param_name = request_param.get("name", "parameter")
-                    param_type = request_param.get("in", "query")  # 'query', 'body', etc.
-                    if param_type == "query":
-                        request_argument = ET.SubElement(collection_prop, "elementProp", name=param_name, elementType="HTTPArgument")
-                        ET.SubElement(request_argument, "boolProp", name="HTTPArgument.always_encode").text = "true"
-                        ET.SubElement(request_argument, "stringProp", name="Argument.name").text = param_name
-                        ET.SubElement(request_argument, "stringProp", name="Argument.value").text = f"${{{param_name}}}"
-                        ET.SubElement(request_argument, "stringProp", name="Argument.metadata").text = "="
-
-                # Add Header Manager for Authorization
-                sampler_hash_tree = ET.SubElement(thread_group_hash_tree, "hashTree")
-                header_manager = ET.SubElement(sampler_hash_tree, "HeaderManager", attrib={
-                    "guiclass": "HeaderPanel", "testclass": "HeaderManager", "testname": "HTTP Header Manager"
-                })
-                header_collection = ET.SubElement(header_manager, "collectionProp", attrib={"name": "HeaderManager.headers"})
-                auth_header = ET.SubElement(header_collection, "elementProp", attrib={"name": "", "elementType": "Header"})
-                ET.SubElement(auth_header, "stringProp", attrib={"name": "Header.name"}).text = "Authorization"
-                ET.SubElement(auth_header, "stringProp", attrib={"name": "Header.value"}).text = "${auth_token}"
-
-        # Add Listeners
-        listeners = [
-            ("View Results Tree", "ViewResultsFullVisualizer"),
-            ("Summary Report", "SummaryReport")
-        ] 
-        for listener_name, guiclass in listeners:
-            listener = ET.SubElement(hash_tree, "ResultCollector", attrib={
-                "guiclass": guiclass, "testclass": "ResultCollector", "testname": listener_name, "enabled": "true"
-            })
-            ET.SubElement(listener, "boolProp", name="ResultCollector.error_logging").text = "false"
-            listener_hash_tree = ET.SubElement(hash_tree, "hashTree")
-                
-        # Write the XML to a file
-        tree = ET.ElementTree(jmeter_test_plan)
-        tree.write(output_file, encoding="UTF-8", xml_declaration=True)
+        # Write the XML to a file, through a 1 MiB buffer so large plans go out in few write calls
+        with open(output_file, "wb", buffering=1 << 20) as fh:
+            fh.write(_JMX_PREAMBLE)
+            fh.write(_render_dynamic_vars(dynamic_vars))
+            fh.write(_JMX_THREAD_GROUP)
+            fh.writelines(sampler_chunks)
+            fh.write(_JMX_EPILOGUE)
         print(f"JMX file generated successfully: {output_file}")
 
     except Exception as e:
@@ -170,8 +245,8 @@ if __name__ == "__main__":
         sys.exit(1)
 
     # Load the Swagger JSON file
-    with open(swagger_file, "r", encoding="utf-8") as f:
-        swagger_data = json.load(f)
+    with open(swagger_file, "rb") as f:
+        swagger_data = json_loads(f.read())
 
     # Generate the JMX file
     generate_jmx_from_swagger(swagger_data)